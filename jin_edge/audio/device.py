@@ -150,17 +150,22 @@ def select_device(index: Optional[int] = None) -> Dict:
     )
 
 
-def find_usb_mic() -> Optional[Dict]:
+def find_usb_mic(input_devices: Optional[List[Dict]] = None) -> Optional[Dict]:
     """
     Automatically detect a USB microphone.
 
     Looks for common USB audio interface patterns in device names.
     Useful for Raspberry Pi where USB mics are commonly used.
 
+    Args:
+        input_devices: Result of a previous list_input_devices() call,
+            to avoid scanning PortAudio devices again (default: scan now)
+
     Returns:
         Device dict if USB mic found, None otherwise
     """
-    input_devices = list_input_devices()
+    if input_devices is None:
+        input_devices = list_input_devices()
 
     # Common USB audio device name patterns
     usb_patterns = [
@@ -263,6 +268,6 @@ def print_input_devices():
     except:
         pass
 
-    usb_mic = find_usb_mic()
+    usb_mic = find_usb_mic(devices)
     if usb_mic:
         print(f"USB microphone detected: {usb_mic['name']}")
@@ -155,10 +155,12 @@ class AudioPlayer:
         self._first_chunk = True
         logger.info("🎵 Playback session started")
 
-    async def feed(self, pcm_bytes: bytes) -> bool:
+    async def feed(self, pcm_bytes: bytes | memoryview) -> bool:
         """
         Feed audio chunk to the playback buffer.
         
+        Accepts bytes or a memoryview; the chunk is buffered without copying.
+        
         Args:
             pcm_bytes: Raw PCM audio data (must be aligned to int16, len % 2 == 0)
         
@@ -293,14 +295,16 @@ class AudioPlayer:
                         logger.debug("Jitter: buffer empty, waiting...")
                     continue
                 
-                # Convert to numpy array
-                audio_data = np.frombuffer(chunk, dtype=np.int16).copy()
+                # Zero-copy view of the chunk
+                audio_data = np.frombuffer(chunk, dtype=np.int16)
                 
                 # Apply fade-in only to the very first chunk of the session
+                # (copy first, the view over the chunk is read-only)
                 if self._first_chunk:
-                    audio_data = apply_fade_in(audio_data, self.fade_samples)
+                    if self.fade_samples > 0:
+                        audio_data = apply_fade_in(audio_data.copy(), self.fade_samples)
+                        logger.debug(f"Applied fade-in ({self.fade_samples} samples)")
                     self._first_chunk = False
-                    logger.debug(f"Applied fade-in ({self.fade_samples} samples)")
                 
                 # Write to output stream
                 try:
@@ -340,8 +344,9 @@ class AudioPlayer:
         
         # Apply fade-out to last chunk
         if last_chunk is not None:
-            audio_data = np.frombuffer(last_chunk, dtype=np.int16).copy()
-            audio_data = apply_fade_out(audio_data, self.fade_samples)
+            audio_data = np.frombuffer(last_chunk, dtype=np.int16)
+            if self.fade_samples > 0:
+                audio_data = apply_fade_out(audio_data.copy(), self.fade_samples)
             try:
                 await asyncio.get_event_loop().run_in_executor(
                     None, self._output_stream.write, audio_data
@@ -0,0 +1,139 @@
+"""
+Lock-free single-producer/single-consumer ring buffer for PCM chunks.
+
+Bridges a capture thread (producer) and the asyncio loop (consumer)
+without locks or per-chunk Python object allocation on the producer side.
+"""
+
+from array import array
+from typing import Optional
+
+
+class PcmRingBuffer:
+    """
+    Fixed-size SPSC ring of PCM chunk slots backed by one bytearray.
+
+    Safe for exactly one producer thread and one consumer thread: the
+    producer only advances the head index and the consumer only advances
+    the tail index, so no lock is needed.
+
+    Usage:
+        ring = PcmRingBuffer(slot_size=960, slots=64)
+
+        # Capture thread
+        if not ring.write(chunk):
+            pass  # Ring full, chunk dropped
+
+        # Consumer
+        while (chunk := ring.read()) is not None:
+            process(chunk)
+
+        # Consumer, without copying the chunk out
+        while (view := ring.peek()) is not None:
+            process(view)
+            ring.advance()
+    """
+
+    def __init__(self, slot_size: int, slots: int = 64):
+        """
+        Initialize ring buffer.
+
+        Args:
+            slot_size: Maximum chunk size in bytes
+            slots: Number of chunk slots (rounded up to a power of two)
+        """
+        if slot_size <= 0:
+            raise ValueError("slot_size must be positive")
+
+        capacity = 1
+        while capacity < max(2, slots):
+            capacity <<= 1
+
+        self.slot_size = slot_size
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._data = bytearray(slot_size * capacity)
+        self._view = memoryview(self._data)
+        self._lengths = array("I", bytes(4 * capacity))
+        self._head = 0  # Written by producer only
+        self._tail = 0  # Written by consumer only
+        self.dropped = 0
+
+    def write(self, chunk: bytes) -> bool:
+        """
+        Copy chunk into the next free slot (producer side).
+
+        Args:
+            chunk: PCM bytes, at most slot_size long
+
+        Returns:
+            True if stored, False if ring full (chunk dropped)
+        """
+        head = self._head
+        if head - self._tail >= self.capacity:
+            self.dropped += 1
+            return False
+
+        size = len(chunk)
+        if size > self.slot_size:
+            raise ValueError(
+                f"Chunk of {size} bytes exceeds slot size {self.slot_size}"
+            )
+
+        slot = head & self._mask
+        offset = slot * self.slot_size
+        self._view[offset : offset + size] = chunk
+        self._lengths[slot] = size
+
+        # Publish only after the slot is fully written
+        self._head = head + 1
+        return True
+
+    def read(self) -> Optional[bytes]:
+        """
+        Pop the oldest chunk (consumer side).
+
+        Returns:
+            Chunk bytes, or None if ring empty
+        """
+        tail = self._tail
+        if tail == self._head:
+            return None
+
+        slot = tail & self._mask
+        offset = slot * self.slot_size
+        chunk = bytes(self._view[offset : offset + self._lengths[slot]])
+
+        # Release the slot only after copying it out
+        self._tail = tail + 1
+        return chunk
+
+    def peek(self) -> Optional[memoryview]:
+        """
+        View the oldest chunk in place (consumer side).
+
+        The view stays valid until advance() releases the slot.
+
+        Returns:
+            Read-only memoryview over the chunk, or None if ring empty
+        """
+        tail = self._tail
+        if tail == self._head:
+            return None
+
+        slot = tail & self._mask
+        offset = slot * self.slot_size
+        return self._view[offset : offset + self._lengths[slot]].toreadonly()
+
+    def advance(self) -> None:
+        """Release the chunk returned by peek() (consumer side)."""
+        if self._tail != self._head:
+            self._tail += 1
+
+    def clear(self) -> None:
+        """Drop all pending chunks (consumer side)."""
+        self._tail = self._head
+
+    def __len__(self) -> int:
+        """Number of chunks waiting to be read."""
+        return self._head - self._tail
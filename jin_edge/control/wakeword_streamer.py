@@ -8,8 +8,10 @@ Clean state management prevents overlapping sessions.
 import asyncio
 import json
 import logging
+import threading
 from typing import Optional, TYPE_CHECKING
 from audio.mic_stream import MicStream
+from audio.ring_buffer import PcmRingBuffer
 from audio.silence_detector import SilenceDetector, SpeechEvent
 from wakeword.base import WakeWordEvent, WakeWordDetector
 from ws.client import WebSocketClient
@@ -74,6 +76,7 @@ class WakeWordStreamer:
         use_relative_silence: Optional[bool] = None,
         relative_silence_threshold: Optional[float] = None,
         led_controller: Optional["LEDController"] = None,
+        wakeup_chunks: int = 4,
     ):
         """
         Initialize wake word streamer.
@@ -91,6 +94,8 @@ class WakeWordStreamer:
             use_relative_silence: Use relative energy threshold based on wake word level (default: True)
             relative_silence_threshold: Ratio of wake word energy for silence threshold (default: from env_vars)
             led_controller: Optional LED controller for visual feedback
+            wakeup_chunks: Chunks captured before the event loop is woken
+                (default: 4, about 120ms of added latency)
         """
         self.ws_client = ws_client
         self.wake_word = wake_word
@@ -166,6 +171,18 @@ class WakeWordStreamer:
             relative_threshold_ratio=relative_silence_threshold,
         )
 
+        # Capture thread -> asyncio handoff (lock-free SPSC ring)
+        chunk_bytes = (
+            getattr(self.mic_stream, "target_chunk_frames", sample_rate * 30 // 1000)
+            * channels
+            * 2
+        )
+        self._ring = PcmRingBuffer(slot_size=chunk_bytes, slots=64)
+        self._wakeup_chunks = max(1, min(wakeup_chunks, self._ring.capacity))
+        self._capture_thread: Optional[threading.Thread] = None
+        self._data_ready = asyncio.Event()
+        self._wakeup_pending = False
+
         # State management
         self._is_running = False
         self._is_streaming = False
@@ -209,29 +226,88 @@ class WakeWordStreamer:
                 pass
             self._stream_task = None
 
+        # Stop capture thread
+        self.mic_stream.stop()
+        if self._capture_thread:
+            await asyncio.to_thread(self._capture_thread.join, 1.0)
+            self._capture_thread = None
+
         logger.info("🛑 Wake word streamer stopped")
 
-    async def _processing_loop(self):
+    def _capture_loop(self, loop: asyncio.AbstractEventLoop):
         """
-        Main processing loop.
-        Runs mic capture and handles wake word + silence detection.
+        Mic capture thread (producer).
+
+        Copies each chunk into the ring buffer and wakes the event loop
+        only once wakeup_chunks chunks are waiting, so each wakeup drains
+        a batch instead of one cross-thread call per chunk. A final wakeup
+        on exit flushes whatever is left.
         """
+        ring = self._ring
+        wakeup_chunks = self._wakeup_chunks
         try:
-            # Run mic capture in executor to avoid blocking
             for chunk in self.mic_stream.stream():
                 if not self._is_running:
-                    self.mic_stream.stop()
                     break
 
-                if self._is_streaming:
-                    # Actively streaming mode
-                    await self._handle_streaming_chunk(chunk)
-                else:
-                    # Listening for wake word mode
-                    await self._handle_listening_chunk(chunk)
+                ring.write(chunk)
 
-                # Yield control to event loop
-                await asyncio.sleep(0)
+                if len(ring) >= wakeup_chunks and not self._wakeup_pending:
+                    self._wakeup_pending = True
+                    loop.call_soon_threadsafe(self._data_ready.set)
+
+        except Exception as e:
+            logger.error(f"Capture thread error: {e}")
+            self._is_running = False
+        finally:
+            self.mic_stream.stop()
+            try:
+                loop.call_soon_threadsafe(self._data_ready.set)
+            except RuntimeError:
+                pass  # Event loop already closed
+            logger.debug("Capture thread completed")
+
+    async def _processing_loop(self):
+        """
+        Main processing loop (consumer).
+        Drains captured audio and handles wake word + silence detection.
+        """
+        self._ring.clear()
+        self._data_ready.clear()
+        self._wakeup_pending = False
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop,
+            args=(asyncio.get_running_loop(),),
+            name="wakeword-capture",
+            daemon=True,
+        )
+        self._capture_thread.start()
+
+        dropped_reported = self._ring.dropped
+        try:
+            while self._is_running:
+                await self._data_ready.wait()
+                self._data_ready.clear()
+                # Clear before draining so chunks written meanwhile re-signal
+                self._wakeup_pending = False
+
+                # Chunks are read in place; only those kept for the
+                # utterance are copied out of the ring
+                while (chunk := self._ring.peek()) is not None:
+                    if self._is_streaming:
+                        # Actively streaming mode
+                        await self._handle_streaming_chunk(bytes(chunk))
+                    else:
+                        # Listening for wake word mode
+                        await self._handle_listening_chunk(chunk)
+                    self._ring.advance()
+
+                dropped = self._ring.dropped
+                if dropped != dropped_reported:
+                    logger.warning(
+                        f"Capture ring overflow, dropped {dropped - dropped_reported} chunks"
+                    )
+                    dropped_reported = dropped
 
         except Exception as e:
             logger.error(f"Processing loop error: {e}")
@@ -239,13 +315,13 @@ class WakeWordStreamer:
         finally:
             logger.debug("Processing loop completed")
 
-    async def _handle_listening_chunk(self, chunk: bytes):
+    async def _handle_listening_chunk(self, chunk: memoryview):
         """
         Process audio chunk while listening for wake word.
         Tracks energy levels to establish baseline for relative silence detection.
 
         Args:
-            chunk: PCM audio bytes
+            chunk: PCM audio view into the capture ring (not kept past the call)
         """
         # Track energy levels during listening phase (for baseline)
         rms = self.silence_detector._calculate_rms(chunk)
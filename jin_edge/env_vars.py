@@ -2,7 +2,9 @@
 
 import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Union
 from dotenv import load_dotenv
 
 # Load .env file from the jin_edge directory
@@ -81,6 +83,26 @@ AUDIO_DEVICE = os.getenv("AUDIO_DEVICE")
 if AUDIO_DEVICE is not None:
     AUDIO_DEVICE = int(AUDIO_DEVICE) if AUDIO_DEVICE.isdigit() else AUDIO_DEVICE
 
+
+@dataclass(frozen=True, slots=True)
+class AudioConfig:
+    """Audio settings resolved once at import, passed to audio components."""
+
+    sample_rate: int
+    channels: int
+    buffer_size: int
+    chunk_size: int
+    device: Optional[Union[int, str]] = None
+
+
+AUDIO_SETTINGS = AudioConfig(
+    sample_rate=AUDIO_SAMPLE_RATE,
+    channels=AUDIO_CHANNELS,
+    buffer_size=AUDIO_BUFFER_SIZE,
+    chunk_size=AUDIO_CHUNK_SIZE,
+    device=AUDIO_DEVICE,
+)
+
 # Connection Settings (from JSON)
 _WS_DEFAULTS = {
     "max_retries": 10,
@@ -113,6 +135,8 @@ __all__ = [
     "AUDIO_BUFFER_SIZE",
     "AUDIO_CHUNK_SIZE",
     "AUDIO_DEVICE",
+    "AudioConfig",
+    "AUDIO_SETTINGS",
     "LOG_LEVEL",
     "WS_MAX_RETRIES",
     "WS_INITIAL_RETRY_DELAY",
@@ -1,6 +1,7 @@
 """LED Daemon Client - Non-privileged communication with LED daemon."""
 
 import socket
+import struct
 import logging
 
 logger = logging.getLogger(__name__)
@@ -35,8 +36,14 @@ class LEDClient:
             sock.settimeout(self.TIMEOUT)
             sock.connect(self.SOCKET_PATH)
             sock.sendall(command.encode())
-            response = sock.recv(1024).decode().strip()
+            data = sock.recv(1024)
             sock.close()
+            # Response is framed as 4-byte little-endian length + payload
+            if len(data) >= 4:
+                (length,) = struct.unpack_from("<I", data)
+                response = data[4 : 4 + length].decode()
+            else:
+                response = ""
             
             if self._available is None:
                 logger.info("LED daemon connected and available")
@@ -16,6 +16,7 @@ Audio-safe configuration:
 import os
 import socket
 import signal
+import struct
 import sys
 import time
 import threading
@@ -72,6 +73,7 @@ class LEDDaemon:
         self.running = False
         self.animation_thread = None
         self.sock = None
+        self._state_lock = threading.Lock()  # Serializes set_state across threads
         
         # Auto-off timer
         self.auto_off_timeout = env_vars.LED_AUTO_OFF_TIMEOUT
@@ -248,41 +250,43 @@ class LEDDaemon:
             print(f"Warning: Unknown state '{state}'")
             return False
         
-        if state == self.current_state:
-            return True
-        
-        self.current_state = state
-        print(f"State changed: {state}")
+        # Client threads and the auto-off timer thread both change state
+        with self._state_lock:
+            if state == self.current_state:
+                return True
         
-        # Reset auto-off timer for non-OFF states
-        if state != self.STATE_OFF:
-            self._reset_auto_off_timer()
-        else:
-            self._cancel_auto_off_timer()
+            self.current_state = state
+            print(f"State changed: {state}")
         
-        # Stop current animation thread if running
-        if self.animation_thread and self.animation_thread.is_alive():
-            self.running = False
-            self.animation_thread.join(timeout=1.0)
-        
-        # Start new animation
-        self.running = True
-        if state == self.STATE_IDLE:
-            self.animation_thread = threading.Thread(target=self._animate_idle, daemon=True)
-            self.animation_thread.start()
-        elif state == self.STATE_LISTENING:
-            self.animation_thread = threading.Thread(target=self._animate_listening, daemon=True)
-            self.animation_thread.start()
-        elif state == self.STATE_THINKING:
-            self.animation_thread = threading.Thread(target=self._animate_thinking, daemon=True)
-            self.animation_thread.start()
-        elif state == self.STATE_SPEAKING:
-            self.animation_thread = threading.Thread(target=self._animate_speaking, daemon=True)
-            self.animation_thread.start()
-        elif state == self.STATE_OFF:
-            self._clear_leds()
+            # Reset auto-off timer for non-OFF states
+            if state != self.STATE_OFF:
+                self._reset_auto_off_timer()
+            else:
+                self._cancel_auto_off_timer()
+        
+            # Stop current animation thread if running
+            if self.animation_thread and self.animation_thread.is_alive():
+                self.running = False
+                self.animation_thread.join(timeout=1.0)
+        
+            # Start new animation
+            self.running = True
+            if state == self.STATE_IDLE:
+                self.animation_thread = threading.Thread(target=self._animate_idle, daemon=True)
+                self.animation_thread.start()
+            elif state == self.STATE_LISTENING:
+                self.animation_thread = threading.Thread(target=self._animate_listening, daemon=True)
+                self.animation_thread.start()
+            elif state == self.STATE_THINKING:
+                self.animation_thread = threading.Thread(target=self._animate_thinking, daemon=True)
+                self.animation_thread.start()
+            elif state == self.STATE_SPEAKING:
+                self.animation_thread = threading.Thread(target=self._animate_speaking, daemon=True)
+                self.animation_thread.start()
+            elif state == self.STATE_OFF:
+                self._clear_leds()
         
-        return True
+            return True
     
     def _clear_leds(self):
         """Turn off all LEDs."""
@@ -447,13 +451,21 @@ class LEDDaemon:
                     return
     
     def handle_client(self, conn):
-        """Handle client connection."""
+        """Handle client connection.
+
+        Serves commands until the client closes the connection, so clients
+        may keep one socket open across state changes. Each response is
+        framed as a 4-byte little-endian length followed by the payload.
+        """
         try:
-            data = conn.recv(1024).decode().strip()
-            if data:
+            conn.settimeout(None)
+            while True:
+                data = conn.recv(1024).decode().strip()
+                if not data:
+                    break
                 success = self.set_state(data)
-                response = "OK" if success else "ERROR"
-                conn.sendall(response.encode())
+                response = b"OK" if success else b"ERROR"
+                conn.sendall(struct.pack("<I", len(response)) + response)
         except Exception as e:
             print(f"Error handling client: {e}")
         finally:
@@ -489,7 +501,9 @@ class LEDDaemon:
                 try:
                     # Non-blocking accept with short timeout
                     conn, _ = self.sock.accept()
-                    self.handle_client(conn)
+                    threading.Thread(
+                        target=self.handle_client, args=(conn,), daemon=True
+                    ).start()
                 except socket.timeout:
                     # No connection, continue loop
                     pass
@@ -12,7 +12,6 @@ import asyncio
 import logging
 import signal
 import sys
-from audio.buffer import AudioBuffer
 from audio.player import AudioPlayer
 from protocol.audio import AudioStreamHandler
 from ws.client import WebSocketClient
@@ -39,17 +38,23 @@ class JinEdgeClient:
     """
 
     def __init__(
-        self, enable_push_to_talk: bool = False, enable_wakeword: bool = False
+        self,
+        enable_push_to_talk: bool = False,
+        enable_wakeword: bool = False,
+        audio_config: env_vars.AudioConfig = env_vars.AUDIO_SETTINGS,
     ):
+        # Audio settings shared by player and input controllers
+        self.audio_config = audio_config
+
         # LED Controller
         self.led_controller = LEDController()
 
         self.audio_player = AudioPlayer(
-            sample_rate=env_vars.AUDIO_SAMPLE_RATE,
-            channels=env_vars.AUDIO_CHANNELS,
-            buffer_size=env_vars.AUDIO_BUFFER_SIZE,
-            chunk_size=env_vars.AUDIO_CHUNK_SIZE,
-            device=env_vars.AUDIO_DEVICE,
+            sample_rate=audio_config.sample_rate,
+            channels=audio_config.channels,
+            buffer_size=audio_config.buffer_size,
+            chunk_size=audio_config.chunk_size,
+            device=audio_config.device,
         )
         # Use the player's internal buffer directly
         self.protocol_handler = AudioStreamHandler(
@@ -101,12 +106,13 @@ class JinEdgeClient:
         await self.ws_client.connect()
 
         # Start input mode if enabled
+        audio_config = self.audio_config
         if self.enable_push_to_talk:
             logger.info("🎤 Enabling push-to-talk mode (Press Enter to record)...")
             self.push_to_talk = PushToTalkController(
                 ws_client=self.ws_client,
-                sample_rate=env_vars.AUDIO_SAMPLE_RATE,
-                channels=env_vars.AUDIO_CHANNELS,
+                sample_rate=audio_config.sample_rate,
+                channels=audio_config.channels,
                 led_controller=self.led_controller,
             )
             await self.push_to_talk.start()
@@ -121,8 +127,8 @@ class JinEdgeClient:
                 self.wakeword_streamer = StreamingWakeWordController(
                     ws_client=self.ws_client,
                     wake_word="hey jin",
-                    sample_rate=env_vars.AUDIO_SAMPLE_RATE,
-                    channels=env_vars.AUDIO_CHANNELS,
+                    sample_rate=audio_config.sample_rate,
+                    channels=audio_config.channels,
                     silence_threshold=500,
                     led_controller=self.led_controller,
                 )
@@ -135,8 +141,8 @@ class JinEdgeClient:
                 self.wakeword_streamer = WakeWordStreamer(
                     ws_client=self.ws_client,
                     wake_word="hey jin",
-                    sample_rate=env_vars.AUDIO_SAMPLE_RATE,
-                    channels=env_vars.AUDIO_CHANNELS,
+                    sample_rate=audio_config.sample_rate,
+                    channels=audio_config.channels,
                     silence_threshold=500,
                     led_controller=self.led_controller,
                 )
@@ -228,4 +234,10 @@ async def main():
 if __name__ == "__main__":
     logger.info("🎯 Jin Edge - Audio Client for Raspberry Pi")
     logger.info("Modes: Default | --ptt (push-to-talk) | --wakeword (voice activation)")
-    asyncio.run(main())
+
+    try:
+        from uvloop import run  # Faster libuv-based event loop if installed
+    except ImportError:
+        from asyncio import run
+
+    run(main())
@@ -21,17 +21,17 @@ def generate_test_tone(frequency=440, duration=1.0, sample_rate=16000):
     Returns:
         bytes: Raw PCM audio data
     """
-    # Generate time array
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-
-    # Generate sine wave
     amplitude = 0.3  # Keep volume moderate
-    audio = amplitude * np.sin(2 * np.pi * frequency * t)
+    num_samples = int(sample_rate * duration)
 
-    # Convert to 16-bit PCM
-    audio_int16 = (audio * 32767).astype(np.int16)
+    # Build the sine wave in a single float32 scratch buffer, in place
+    audio = np.arange(num_samples, dtype=np.float32)
+    audio *= 2 * np.pi * frequency / sample_rate
+    np.sin(audio, out=audio)
+    audio *= amplitude * 32767
 
-    return audio_int16.tobytes()
+    # Convert to 16-bit PCM
+    return audio.astype(np.int16).tobytes()
 
 
 async def test_rapid_play_switch():
@@ -157,4 +157,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        from uvloop import run  # Faster libuv-based event loop if installed
+    except ImportError:
+        from asyncio import run
+
+    run(main())
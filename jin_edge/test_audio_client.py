@@ -4,7 +4,6 @@ Test audio client that connects to test server and plays received audio.
 
 import asyncio
 import logging
-from audio.buffer import AudioBuffer
 from audio.player import AudioPlayer
 from protocol.audio import AudioStreamHandler
 from ws.client import WebSocketClient
@@ -16,20 +15,46 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class QueuedAudioStreamHandler(AudioStreamHandler):
+    """
+    Stream handler that hands audio frames to a bounded queue.
+
+    The queue sits between the WebSocket receive loop (producer) and the
+    player feeder task (consumer): put() blocks when the queue is full and
+    get() blocks when it is empty, so no polling or sleeps are needed.
+    """
+
+    def __init__(self, queue: asyncio.Queue, audio_player: AudioPlayer):
+        super().__init__(audio_player._buffer, audio_player)
+        self._queue = queue
+
+    async def handle_binary_message(self, data: bytes):
+        """Queue audio chunk for the feeder task (backpressure via put())."""
+        if not self._active_stream_id or not data:
+            return
+
+        await self._queue.put(data)
+
+    async def _handle_audio_end(self, data: dict):
+        """Let queued chunks reach the player before ending the session."""
+        await self._queue.join()
+        await super()._handle_audio_end(data)
+
+
 class AudioTestClient:
     """Test client for audio streaming over WebSocket."""
 
     def __init__(self):
-        self.buffer = AudioBuffer(max_size=2 * 1024 * 1024)  # 2MB buffer
         self.player = AudioPlayer(
             sample_rate=16000, channels=1, dtype="int16", buffer_size=2 * 1024 * 1024
         )
-        self.handler = AudioStreamHandler(self.buffer)
+        # Bounded queue between protocol handler and player feeder
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+        self.handler = QueuedAudioStreamHandler(self._queue, self.player)
         self.client: WebSocketClient | None = None
 
-        # Start player feeder task
+        # Player feeder task
         self._feeder_task: asyncio.Task | None = None
-        self._running = False
 
     async def on_connect(self):
         """Called when connected to server."""
@@ -52,8 +77,7 @@ class AudioTestClient:
         await self.player.start()
         logger.info("Audio player started")
 
-        # Start buffer feeder
-        self._running = True
+        # Start queue feeder
         self._feeder_task = asyncio.create_task(self._feed_player())
 
         # Create WebSocket client with protocol handler
@@ -70,47 +94,37 @@ class AudioTestClient:
 
     async def _feed_player(self):
         """
-        Continuously feed audio from buffer to player.
-        Runs in background task.
+        Continuously feed audio from queue to player.
+        Runs in background task until cancelled.
         """
-        logger.info("Buffer feeder started")
-        playback_started = False
-
-        while self._running:
-            # Check if there's audio in the buffer
-            buffer_size = await self.buffer.size()
-
-            if buffer_size > 0:
-                # Pull chunk from buffer
-                chunk = await self.buffer.pop(chunk_size=4096)
-                if chunk:
-                    # Start playback with first chunk
-                    if not playback_started:
-                        logger.info("Starting audio playback with first chunk...")
-                        await self.player.play(chunk)
-                        playback_started = True
+        logger.info("Queue feeder started")
+
+        try:
+            while True:
+                chunk = await self._queue.get()
+                try:
+                    success = await self.player.feed(chunk)
+                    if success:
+                        logger.debug(f"Fed {len(chunk)} bytes to player")
                     else:
-                        # Feed subsequent chunks
-                        success = await self.player.feed(chunk)
-                        if not success:
-                            logger.warning("Player buffer full, waiting...")
-                            await asyncio.sleep(0.01)
-                        else:
-                            logger.debug(f"Fed {len(chunk)} bytes to player")
-            else:
-                # No data, sleep to avoid busy waiting
-                await asyncio.sleep(0.01)
-
-        logger.info("Buffer feeder stopped")
+                        logger.warning(f"Player rejected {len(chunk)} bytes")
+                finally:
+                    self._queue.task_done()
+        except asyncio.CancelledError:
+            logger.info("Queue feeder stopped")
 
     async def stop(self):
         """Stop the audio client."""
         logger.info("Stopping audio client")
 
         # Stop feeder
-        self._running = False
         if self._feeder_task:
-            await self._feeder_task
+            self._feeder_task.cancel()
+            try:
+                await self._feeder_task
+            except asyncio.CancelledError:
+                pass
+            self._feeder_task = None
 
         # Close WebSocket
         if self.client:
@@ -135,11 +149,11 @@ class AudioTestClient:
             # Show status updates
             for i in range(int(duration)):
                 await asyncio.sleep(1)
-                buffer_size = await self.buffer.size()
+                queued = self._queue.qsize()
                 player_buffer = await self.player.buffer_size()
                 stream_id = self.handler.active_stream_id
                 logger.info(
-                    f"[{i+1}s] Buffer: {buffer_size} bytes, "
+                    f"[{i+1}s] Queue: {queued} chunks, "
                     f"Player: {player_buffer} bytes, "
                     f"Stream: {stream_id or 'none'}"
                 )
@@ -158,6 +172,11 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        from uvloop import run  # Faster libuv-based event loop if installed
+    except ImportError:
+        from asyncio import run
+
+    try:
+        run(main())
     except KeyboardInterrupt:
         logger.info("Client stopped by user")
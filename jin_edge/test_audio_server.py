@@ -4,9 +4,10 @@ Generates simple tone audio for testing.
 """
 
 import asyncio
-import json
 import logging
+import time
 import numpy as np
+import orjson
 import websockets
 from websockets.asyncio.server import serve
 
@@ -17,6 +18,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def generate_tone_view(
+    frequency: int, duration: float, sample_rate: int = 16000
+) -> memoryview:
+    """
+    Generate a simple sine wave tone as a read-only PCM byte view.
+
+    Args:
+        frequency: Tone frequency in Hz
+        duration: Duration in seconds
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Read-only byte view over the int16 samples (16-bit, mono)
+    """
+    num_samples = int(duration * sample_rate)
+
+    # Phase = sample index * per-sample phase step, all in float32 in place
+    tone = np.arange(num_samples, dtype=np.float32)
+    tone *= np.float32(2 * np.pi * frequency / sample_rate)
+    np.sin(tone, out=tone)
+
+    # Convert to 16-bit PCM
+    np.multiply(tone, 32767, out=tone)
+    samples = tone.astype(np.int16, copy=False)
+
+    samples.flags.writeable = False
+    return memoryview(samples).cast("B")
+
+
 def generate_tone(frequency: int, duration: float, sample_rate: int = 16000) -> bytes:
     """
     Generate a simple sine wave tone as PCM bytes.
@@ -29,13 +59,24 @@ def generate_tone(frequency: int, duration: float, sample_rate: int = 16000) ->
     Returns:
         Raw PCM bytes (16-bit, mono)
     """
-    num_samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, num_samples, False)
-    tone = np.sin(2 * np.pi * frequency * t)
+    return generate_tone_view(frequency, duration, sample_rate).tobytes()
 
-    # Convert to 16-bit PCM
-    audio_data = (tone * 32767).astype(np.int16)
-    return audio_data.tobytes()
+
+SAMPLE_RATE = 16000
+
+# Tones streamed to every client: (frequency Hz, duration s)
+TONES = [
+    (440, 1.0),  # A4 for 1 second
+    (523, 1.0),  # C5 for 1 second
+    (659, 1.0),  # E5 for 1 second
+    (784, 1.0),  # G5 for 1 second
+]
+
+# PCM synthesized once at startup and shared by all connections
+_TONE_POOL: dict[tuple[int, float], memoryview] = {
+    (frequency, duration): generate_tone_view(frequency, duration, SAMPLE_RATE)
+    for frequency, duration in TONES
+}
 
 
 async def audio_stream_handler(websocket):
@@ -50,41 +91,37 @@ async def audio_stream_handler(websocket):
 
     try:
         # Send audio_start message
-        stream_id = f"test_stream_{asyncio.get_event_loop().time()}"
-        sample_rate = 16000
+        stream_id = f"test_stream_{time.monotonic()}"
+        sample_rate = SAMPLE_RATE
 
         start_msg = {
             "type": "audio_start",
             "stream_id": stream_id,
             "sample_rate": sample_rate,
         }
-        await websocket.send(json.dumps(start_msg))
+        await websocket.send(orjson.dumps(start_msg), text=True)
         logger.info(f"Sent audio_start: {start_msg}")
 
         # Wait a bit before sending audio
         await asyncio.sleep(0.5)
 
-        # Generate and send multiple tones
-        tones = [
-            (440, 1.0),  # A4 for 1 second
-            (523, 1.0),  # C5 for 1 second
-            (659, 1.0),  # E5 for 1 second
-            (784, 1.0),  # G5 for 1 second
-        ]
+        # Send multiple tones from the preallocated pool
+        for frequency, duration in TONES:
+            logger.info(f"Streaming {frequency}Hz tone for {duration}s")
+            audio_view = _TONE_POOL[(frequency, duration)]  # Zero-copy slicing
 
-        for frequency, duration in tones:
-            logger.info(f"Generating {frequency}Hz tone for {duration}s")
-            audio_data = generate_tone(frequency, duration, sample_rate)
-
-            # Send audio in chunks (simulate streaming)
+            # Send audio in batches of chunks (simulate streaming with
+            # fewer WebSocket frames and event loop round-trips)
             chunk_size = 4096
-            for i in range(0, len(audio_data), chunk_size):
-                chunk = audio_data[i : i + chunk_size]
-                await websocket.send(chunk)
-                logger.debug(f"Sent {len(chunk)} bytes")
+            chunks_per_batch = 4
+            batch_size = chunk_size * chunks_per_batch
+            for i in range(0, len(audio_view), batch_size):
+                batch = audio_view[i : i + batch_size]
+                await websocket.send(batch)
+                logger.debug(f"Sent {len(batch)} bytes")
 
-                # Small delay to simulate streaming
-                await asyncio.sleep(0.02)
+                # Delay per batch keeps the original per-chunk pacing
+                await asyncio.sleep(0.02 * chunks_per_batch)
 
             # Small gap between tones
             await asyncio.sleep(0.1)
@@ -94,7 +131,7 @@ async def audio_stream_handler(websocket):
 
         # Send audio_end message
         end_msg = {"type": "audio_end", "stream_id": stream_id}
-        await websocket.send(json.dumps(end_msg))
+        await websocket.send(orjson.dumps(end_msg), text=True)
         logger.info(f"Sent audio_end: {end_msg}")
 
         # Keep connection open for a bit
@@ -115,13 +152,26 @@ async def main():
 
     logger.info(f"Starting audio server on ws://{host}:{port}")
 
-    async with serve(audio_stream_handler, host, port):
+    # PCM barely compresses, so skip permessage-deflate entirely
+    async with serve(
+        audio_stream_handler,
+        host,
+        port,
+        compression=None,
+        max_size=2**22,
+        write_limit=2**20,
+    ):
         logger.info(f"Server ready! Connect client to ws://{host}:{port}")
         await asyncio.Future()  # Run forever
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        from uvloop import run  # Faster libuv-based event loop if installed
+    except ImportError:
+        from asyncio import run
+
+    try:
+        run(main())
     except KeyboardInterrupt:
         logger.info("Server stopped")
@@ -1,9 +1,28 @@
 """Simple test client for LED daemon."""
 
+import asyncio
 import sys
-import time
 from led.client import LEDClient
 
+
+async def cycle_states(client: LEDClient, states: list[str], hold: float = 3.0) -> bool:
+    """Show each state for `hold` seconds, in order.
+
+    The daemon round-trip runs in a worker thread alongside the hold timer,
+    so each step takes `hold` seconds instead of `hold` plus the command RTT.
+    """
+    for state in states:
+        print(f"State: {state}")
+        success, _ = await asyncio.gather(
+            asyncio.to_thread(client.set_state, state), asyncio.sleep(hold)
+        )
+        if not success:
+            print(f"  ERROR: Failed to set state {state}")
+            return False
+        print(f"  OK")
+    return True
+
+
 def main():
     """Test LED daemon communication."""
     client = LEDClient()
@@ -26,14 +45,8 @@ def main():
         print("Make sure the LED daemon is running: sudo systemctl status jin-led")
         print()
         
-        for state in states:
-            print(f"State: {state}")
-            success = client.set_state(state)
-            if not success:
-                print(f"  ERROR: Failed to set state {state}")
-                sys.exit(1)
-            print(f"  OK")
-            time.sleep(3)
+        if not asyncio.run(cycle_states(client, states)):
+            sys.exit(1)
         
         print("\nAll tests passed!")
 
@@ -7,36 +7,96 @@ Then run this script without sudo: python test_led_daemon.py
 """
 
 import socket
+import struct
 import time
 import sys
 
 
 class LEDDaemonClient:
-    """Client for communicating with LED daemon."""
+    """Client for communicating with LED daemon.
+    
+    Keeps one socket open across commands and reconnects on error.
+    """
     
     SOCKET_PATH = "/tmp/jin_led.sock"
+    HEADER = struct.Struct("<I")  # Response length prefix
     
-    def send_command(self, state):
-        """Send state command to daemon."""
+    def __init__(self):
+        """Initialize client (connects lazily on first command)."""
+        self._sock = None
+        # Preallocated receive buffer, responses are tiny ("OK"/"ERROR")
+        self._buf = bytearray(64)
+        self._view = memoryview(self._buf)
+    
+    def _connect(self):
+        """Open the persistent daemon connection."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             sock.connect(self.SOCKET_PATH)
-            sock.sendall(state.encode())
-            response = sock.recv(1024).decode()
+        except Exception:
             sock.close()
-            return response
+            raise
+        self._sock = sock
+    
+    def _recv_exact(self, size):
+        """Read exactly size bytes into the start of the receive buffer."""
+        received = 0
+        while received < size:
+            n = self._sock.recv_into(self._view[received:size])
+            if not n:
+                raise ConnectionError("LED daemon closed the connection")
+            received += n
+    
+    def _request(self, state):
+        """Send command and read the length-prefixed response."""
+        if self._sock is None:
+            self._connect()
+        self._sock.sendall(state.encode())
+        self._recv_exact(self.HEADER.size)
+        (length,) = self.HEADER.unpack_from(self._buf)
+        if length > len(self._buf):
+            raise ConnectionError(f"Response too large: {length} bytes")
+        self._recv_exact(length)
+        return self._buf[:length].decode()
+    
+    def send_command(self, state):
+        """Send state command to daemon."""
+        try:
+            try:
+                return self._request(state)
+            except (BrokenPipeError, ConnectionError):
+                # Cached connection went stale (e.g. daemon restart), retry once
+                self.close()
+                return self._request(state)
         except FileNotFoundError:
+            self.close()
             print(f"ERROR: Socket not found at {self.SOCKET_PATH}")
             print("Is the LED daemon running? Start it with: sudo python led/daemon.py")
             return None
         except ConnectionRefusedError:
+            self.close()
             print("ERROR: Connection refused")
             print("Is the LED daemon running? Start it with: sudo python led/daemon.py")
             return None
         except Exception as e:
+            self.close()
             print(f"ERROR: {e}")
             return None
     
+    def close(self):
+        """Close the daemon connection."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+    
+    def __enter__(self):
+        """Context manager support."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager support."""
+        self.close()
+    
     def test_state(self, state, duration=3):
         """Test a specific LED state."""
         print(f"\nTesting state: {state}")
@@ -133,22 +193,21 @@ class LEDDaemonClient:
 
 def main():
     """Main entry point."""
-    client = LEDDaemonClient()
-    
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
-        if command == "interactive":
-            client.interactive_mode()
-        elif command == "responsive" or command == "responsiveness":
-            client.test_responsiveness()
-        elif command in ["idle", "listening", "thinking", "speaking", "off"]:
-            client.test_state(command, duration=0)
+    with LEDDaemonClient() as client:
+        if len(sys.argv) > 1:
+            command = sys.argv[1].lower()
+            if command == "interactive":
+                client.interactive_mode()
+            elif command == "responsive" or command == "responsiveness":
+                client.test_responsiveness()
+            elif command in ["idle", "listening", "thinking", "speaking", "off"]:
+                client.test_state(command, duration=0)
+            else:
+                print(f"Usage: {sys.argv[0]} [interactive|responsive|idle|listening|thinking|speaking|off]")
+                print(f"       {sys.argv[0]}  # runs all tests")
         else:
-            print(f"Usage: {sys.argv[0]} [interactive|responsive|idle|listening|thinking|speaking|off]")
-            print(f"       {sys.argv[0]}  # runs all tests")
-    else:
-        # Run all tests by default
-        client.test_all_states()
+            # Run all tests by default
+            client.test_all_states()
 
 
 if __name__ == "__main__":
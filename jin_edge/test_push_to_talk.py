@@ -64,4 +64,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        from uvloop import run  # Faster libuv-based event loop if installed
+    except ImportError:
+        from asyncio import run
+
+    run(main())
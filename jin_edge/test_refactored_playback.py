@@ -12,18 +12,68 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def generate_tone(frequency: int, duration_ms: int, sample_rate: int = 16000) -> bytes:
-    """Generate a sine wave tone."""
-    duration_sec = duration_ms / 1000.0
-    num_samples = int(sample_rate * duration_sec)
-    t = np.linspace(0, duration_sec, num_samples, dtype=np.float32)
+# Hann ramp halves for producer-side fades (same length as the player's fade)
+FADE_SAMPLES = 100
+_HANN = np.hanning(2 * FADE_SAMPLES).astype(np.float32)
+_FADE_IN, _FADE_OUT = _HANN[:FADE_SAMPLES], _HANN[FADE_SAMPLES:]
+
+
+def generate_tone_view(
+    frequency: int, duration_ms: int, sample_rate: int = 16000, fade: bool = False
+) -> memoryview:
+    """
+    Generate a sine wave tone as a read-only byte view over int16 samples.
     
-    # Generate sine wave
+    With fade=True the first and last FADE_SAMPLES samples are shaped by a
+    Hann ramp, so the player can be run with fade_samples=0.
+    """
+    num_samples = int(sample_rate * duration_ms / 1000)
     amplitude = 8000  # Safe amplitude for int16
-    tone = amplitude * np.sin(2 * np.pi * frequency * t)
+    
+    # Generate sine wave from sample index * phase step, in place in float32
+    tone = np.arange(num_samples, dtype=np.float32)
+    tone *= np.float32(2 * np.pi * frequency / sample_rate)
+    np.sin(tone, out=tone)
+    tone *= amplitude
     
     # Convert to int16
-    return tone.astype(np.int16).tobytes()
+    samples = tone.astype(np.int16)
+    
+    if fade:
+        ramp = min(FADE_SAMPLES, num_samples // 2)
+        if ramp:
+            samples[:ramp] = samples[:ramp] * _FADE_IN[:ramp]
+            samples[-ramp:] = samples[-ramp:] * _FADE_OUT[FADE_SAMPLES - ramp :]
+    
+    samples.flags.writeable = False
+    return memoryview(samples).cast("B")
+
+
+def generate_tone(
+    frequency: int, duration_ms: int, sample_rate: int = 16000, fade: bool = False
+) -> bytes:
+    """Generate a sine wave tone as PCM bytes (copy of generate_tone_view)."""
+    return generate_tone_view(frequency, duration_ms, sample_rate, fade).tobytes()
+
+
+def precompute() -> dict[tuple[int, int], memoryview]:
+    """Generate every (frequency, duration_ms) tone the tests feed, once."""
+    tones = {
+        (frequency, 20): generate_tone_view(frequency, 20)
+        for frequency in (440, 540, 640)
+    }
+    # Pre-faded tone for playback without the player's fade pass
+    tones[(440, 200)] = generate_tone_view(440, 200, fade=True)
+    return tones
+
+
+# Shared immutable PCM chunks, reused across tests and sessions
+TONES = precompute()
+
+# 1 second (50 x 20ms) of zero-copy views per frequency, fed as-is
+CHUNKS = {
+    frequency: [TONES[(frequency, 20)]] * 50 for frequency in (440, 540, 640)
+}
 
 
 async def test_session_playback():
@@ -48,10 +98,9 @@ async def test_session_playback():
         assert player.state == PlaybackState.IDLE, "Should start in IDLE"
         
         # Feed multiple chunks (20ms each)
-        chunk_20ms = generate_tone(440, 20)  # A4 note
-        
-        for i in range(10):  # 200ms total
-            success = await player.feed(chunk_20ms)
+        # A4 note, 200ms total
+        for i, chunk in enumerate(CHUNKS[440][:10]):
+            success = await player.feed(chunk)
             assert success, f"Failed to feed chunk {i}"
             await asyncio.sleep(0.01)  # Small delay to simulate network
         
@@ -91,10 +140,8 @@ async def test_continuous_playback():
         await player.begin_session()
         
         # Feed chunks continuously to simulate TTS streaming
-        chunk_20ms = generate_tone(440, 20)
-        
-        for i in range(50):  # 1 second of audio
-            success = await player.feed(chunk_20ms)
+        for i, chunk in enumerate(CHUNKS[440]):  # 1 second of audio
+            success = await player.feed(chunk)
             assert success, f"Failed to feed chunk {i}"
             await asyncio.sleep(0.015)  # Slightly slower than real-time
         
@@ -126,9 +173,8 @@ async def test_interrupt():
         await player.begin_session()
         
         # Feed initial chunks
-        chunk_20ms = generate_tone(440, 20)
-        for i in range(5):
-            await player.feed(chunk_20ms)
+        for chunk in CHUNKS[440][:5]:
+            await player.feed(chunk)
             await asyncio.sleep(0.01)
         
         logger.info("✓ Playback started")
@@ -167,10 +213,9 @@ async def test_multiple_sessions():
             
             # Different frequency for each session
             frequency = 440 + (session_num * 100)
-            chunk_20ms = generate_tone(frequency, 20)
             
-            for i in range(10):
-                await player.feed(chunk_20ms)
+            for chunk in CHUNKS[frequency][:10]:
+                await player.feed(chunk)
                 await asyncio.sleep(0.01)
             
             await player.end_session()
@@ -197,13 +242,11 @@ async def test_jitter_handling():
         await player.start()
         await player.begin_session()
         
-        chunk_20ms = generate_tone(440, 20)
-        
         # Irregular timing to simulate network jitter
         delays = [0.01, 0.05, 0.01, 0.08, 0.02, 0.01, 0.06, 0.01] * 3
         
-        for i, delay in enumerate(delays):
-            await player.feed(chunk_20ms)
+        for chunk, delay in zip(CHUNKS[440], delays):
+            await player.feed(chunk)
             await asyncio.sleep(delay)
         
         logger.info("✓ Fed chunks with jitter")
@@ -217,6 +260,38 @@ async def test_jitter_handling():
         await player.stop()
 
 
+async def test_prefaded_playback():
+    """Test playback of a producer-faded tone with the player's fade disabled."""
+    logger.info("\n=== Test 6: Pre-faded tone (player fade off) ===")
+    
+    player = AudioPlayer(
+        sample_rate=16000,
+        channels=1,
+        buffering_chunks=2,
+        fade_samples=0,  # Fade already baked into the tone
+    )
+    
+    try:
+        await player.start()
+        await player.begin_session()
+        
+        # Feed the 200ms pre-faded tone as 20ms chunks (640 bytes each)
+        tone = TONES[(440, 200)]
+        for i in range(0, len(tone), 640):
+            await player.feed(tone[i : i + 640])
+            await asyncio.sleep(0.01)
+        
+        logger.info("✓ Fed pre-faded tone")
+        
+        await player.end_session()
+        await asyncio.sleep(0.5)
+        
+        logger.info("✅ Test 6 passed (listen for clicks)\n")
+        
+    finally:
+        await player.stop()
+
+
 async def main():
     """Run all tests."""
     logger.info("=" * 60)
@@ -229,6 +304,7 @@ async def main():
         await test_interrupt()
         await test_multiple_sessions()
         await test_jitter_handling()
+        await test_prefaded_playback()
         
         logger.info("\n" + "=" * 60)
         logger.info("✅ All tests passed!")
@@ -240,4 +316,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        from uvloop import run  # Faster libuv-based event loop if installed
+    except ImportError:
+        from asyncio import run
+
+    run(main())
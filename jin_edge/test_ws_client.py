@@ -3,8 +3,10 @@ Test WebSocket client with echo server.
 """
 
 import asyncio
-import json
 import logging
+import struct
+import time
+import orjson
 from ws.client import WebSocketClient
 
 
@@ -15,6 +17,36 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Little-endian length prefix for each record in a batched frame
+RECORD_HEADER = struct.Struct("<I")
+
+
+def pack_records(*records: bytes) -> bytes:
+    """Concatenate records into one frame, each prefixed by its length."""
+    return b"".join(RECORD_HEADER.pack(len(record)) + record for record in records)
+
+
+def unpack_records(frame: bytes) -> list[bytes] | None:
+    """
+    Split a batched frame back into its records.
+
+    Returns:
+        List of records, or None if frame is not length-prefixed
+    """
+    records = []
+    view = memoryview(frame)
+    offset = 0
+    while offset < len(view):
+        if offset + RECORD_HEADER.size > len(view):
+            return None
+        (size,) = RECORD_HEADER.unpack_from(view, offset)
+        offset += RECORD_HEADER.size
+        if offset + size > len(view):
+            return None
+        records.append(bytes(view[offset : offset + size]))
+        offset += size
+    return records
+
 
 class TestWebSocketClient:
     """Test class for WebSocket client."""
@@ -35,6 +67,10 @@ class TestWebSocketClient:
         """
         Called when a message is received.
 
+        The test only sends binary frames, so echoed messages arrive as
+        bytes and skip the UTF-8 validation applied to text frames. Text
+        frames sent by the server itself are just logged.
+
         Args:
             message: Received message (text or binary)
         """
@@ -42,10 +78,20 @@ class TestWebSocketClient:
 
         if isinstance(message, str):
             logger.info(f"📨 Received text message #{self.message_count}: {message}")
-        else:
+            return
+
+        records = unpack_records(message)
+        if records is None:
             logger.info(
                 f"📨 Received binary message #{self.message_count}: {len(message)} bytes"
             )
+            return
+
+        logger.info(
+            f"📨 Received batch #{self.message_count}: {len(records)} records"
+        )
+        for record in records:
+            logger.info(f"   • {len(record)} bytes: {record!r}")
 
     async def run_test(self):
         """Run the WebSocket client test."""
@@ -58,6 +104,7 @@ class TestWebSocketClient:
             max_retries=3,
             initial_retry_delay=1.0,
             max_retry_delay=10.0,
+            compression=None,
         )
 
         try:
@@ -72,28 +119,22 @@ class TestWebSocketClient:
                 logger.error("Failed to connect")
                 return
 
-            # Send some test messages
-            logger.info("📤 Sending text message...")
-            await self.client.send_text(
-                json.dumps(
-                    {
-                        "type": "test",
-                        "message": "Hello from WebSocket client!",
-                        "timestamp": asyncio.get_event_loop().time(),
-                    }
+            # Send all test messages as one length-prefixed binary frame
+            logger.info("📤 Sending batched JSON, text and binary messages...")
+            await self.client.send_binary(
+                pack_records(
+                    orjson.dumps(
+                        {
+                            "type": "test",
+                            "message": "Hello from WebSocket client!",
+                            "timestamp": time.monotonic(),
+                        }
+                    ),
+                    "Simple text message".encode(),
+                    b"Binary test data: \x00\x01\x02\x03",
                 )
             )
 
-            await asyncio.sleep(1)
-
-            logger.info("📤 Sending another text message...")
-            await self.client.send_text("Simple text message")
-
-            await asyncio.sleep(1)
-
-            logger.info("📤 Sending binary message...")
-            await self.client.send_binary(b"Binary test data: \x00\x01\x02\x03")
-
             # Wait for responses
             logger.info("⏳ Waiting for responses...")
             await asyncio.sleep(3)
@@ -120,4 +161,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        from uvloop import run  # Faster libuv-based event loop if installed
+    except ImportError:
+        from asyncio import run
+
+    run(main())
@@ -96,7 +96,7 @@ class WakeWordDetector(ABC):
         Returns:
             WakeWordEvent.DETECTED
         """
-        logger.info(f"Wake word detected: '{self.wake_word}'")
+        logger.info("Wake word detected: '%s'", self.wake_word)
         if self.on_detection:
             self.on_detection()
         return WakeWordEvent.DETECTED
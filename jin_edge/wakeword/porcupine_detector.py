@@ -5,9 +5,8 @@ Uses Picovoice's Porcupine for accurate wake word detection.
 Low CPU, optimized for Raspberry Pi.
 """
 
-import struct
 import logging
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 import os
 
 try:
@@ -40,6 +39,8 @@ class PorcupineDetector(WakeWordDetector):
         )
 
         for chunk in mic_stream:
+            if not detector.is_listening:
+                continue  # Paused: skip the call entirely
             event = detector.process_chunk(chunk)
             if event:
                 # Wake word detected
@@ -80,14 +81,11 @@ class PorcupineDetector(WakeWordDetector):
         if not access_key:
             raise ValueError("Porcupine access key required")
 
-        if not os.path.exists(model_path):
-            raise FileNotFoundError(f"Model file not found: {model_path}")
-
         self.access_key = access_key
         self.model_path = model_path
         self.sensitivity = sensitivity
 
-        # Initialize Porcupine
+        # Initialize Porcupine (it validates the model path itself)
         try:
             self._porcupine = pvporcupine.create(
                 access_key=access_key,
@@ -95,19 +93,30 @@ class PorcupineDetector(WakeWordDetector):
                 sensitivities=[sensitivity],
             )
             logger.info(
-                f"Porcupine detector initialized "
-                f"(model={os.path.basename(model_path)}, "
-                f"sensitivity={sensitivity}, "
-                f"sample_rate={self._porcupine.sample_rate}, "
-                f"frame_length={self._porcupine.frame_length})"
+                "Porcupine detector initialized "
+                "(model=%s, sensitivity=%s, sample_rate=%d, frame_length=%d)",
+                os.path.basename(model_path),
+                sensitivity,
+                self._porcupine.sample_rate,
+                self._porcupine.frame_length,
             )
+        except pvporcupine.PorcupineIOError as e:
+            logger.error("Failed to initialize Porcupine: %s", e)
+            raise FileNotFoundError(f"Model file not found: {model_path}") from e
         except Exception as e:
-            logger.error(f"Failed to initialize Porcupine: {e}")
+            logger.error("Failed to initialize Porcupine: %s", e)
             raise
 
-        # Audio buffer for accumulating samples
-        self._audio_buffer = []
-        self._samples_needed = self._porcupine.frame_length
+        # Fixed-size circular PCM byte buffer plus scratch for wrapped frames;
+        # indices and counts are in bytes
+        self._frame_bytes = self._porcupine.frame_length * 2
+        self._audio_buffer = bytearray(self._frame_bytes * 8)
+        self._ring_view = memoryview(self._audio_buffer)
+        self._frame_scratch = bytearray(self._frame_bytes)
+        self._scratch_frame = memoryview(self._frame_scratch).cast("h")
+        self._read_index = 0
+        self._write_index = 0
+        self._buffered = 0
 
     def process_chunk(self, pcm_bytes: bytes) -> Optional[WakeWordEvent]:
         """
@@ -125,18 +134,74 @@ class PorcupineDetector(WakeWordDetector):
         if not pcm_bytes or len(pcm_bytes) < 2:
             return None
 
-        # Convert bytes to 16-bit samples
-        num_samples = len(pcm_bytes) // 2
-        samples = struct.unpack(f"<{num_samples}h", pcm_bytes)
+        # Add whole 16-bit samples to buffer
+        return self._ingest(pcm_bytes[: len(pcm_bytes) & ~1])
+
+    def process_chunks(self, chunks: Iterable[bytes]) -> Optional[WakeWordEvent]:
+        """
+        Process many audio chunks in one call (e.g. offline file scanning).
+
+        Stops at the first detection; chunks after it are not consumed.
+
+        Args:
+            chunks: Iterable of raw PCM audio bytes (16-bit signed int)
+
+        Returns:
+            WakeWordEvent.DETECTED if wake word found, None otherwise
+        """
+        if not self._is_listening:
+            return None
+
+        ingest = self._ingest
+
+        for pcm_bytes in chunks:
+            event = ingest(pcm_bytes[: len(pcm_bytes) & ~1])
+            if event:
+                return event
+
+        return None
+
+    def _ingest(self, pcm_bytes: bytes) -> Optional[WakeWordEvent]:
+        """
+        Feed PCM bytes through the ring without dropping samples.
+
+        Chunks larger than the free space are added in pieces, running
+        Porcupine on the buffered frames between pieces. Stops at the first
+        detection; the rest of the chunk is not consumed.
+
+        Args:
+            pcm_bytes: Raw PCM bytes (even length)
+
+        Returns:
+            WakeWordEvent.DETECTED if wake word found, None otherwise
+        """
+        view = memoryview(pcm_bytes)
+        capacity = len(self._audio_buffer)
+        offset = 0
+
+        while offset < len(view):
+            # Free space is never below capacity - frame_bytes once the
+            # complete frames have been processed
+            piece = view[offset : offset + capacity - self._buffered]
+            self._append_bytes(piece)
+            offset += len(piece)
+
+            if self._buffered >= self._frame_bytes:
+                event = self._process_frames()
+                if event:
+                    return event
+
+        return None
 
-        # Add to buffer
-        self._audio_buffer.extend(samples)
+    def _process_frames(self) -> Optional[WakeWordEvent]:
+        """
+        Run Porcupine on every complete frame in the buffer.
 
-        # Process when we have enough samples
-        while len(self._audio_buffer) >= self._samples_needed:
-            # Extract frame
-            frame = self._audio_buffer[: self._samples_needed]
-            self._audio_buffer = self._audio_buffer[self._samples_needed :]
+        Returns:
+            WakeWordEvent.DETECTED on the first detection, None otherwise
+        """
+        while self._buffered >= self._frame_bytes:
+            frame = self._next_frame()
 
             # Run detection
             try:
@@ -144,30 +209,90 @@ class PorcupineDetector(WakeWordDetector):
 
                 if keyword_index >= 0:
                     logger.info(
-                        f"Porcupine detected wake word "
-                        f"(keyword_index={keyword_index})"
+                        "Porcupine detected wake word (keyword_index=%d)",
+                        keyword_index,
                     )
                     return self._trigger_detection()
 
             except Exception as e:
-                logger.error(f"Porcupine processing error: {e}")
+                logger.error("Porcupine processing error: %s", e)
 
         return None
 
+    def _append_bytes(self, pcm_bytes: bytes) -> None:
+        """
+        Copy PCM bytes into the ring, wrapping at the end of the buffer.
+
+        Callers must not pass more bytes than the ring has free (see _ingest).
+
+        Args:
+            pcm_bytes: Raw PCM bytes (even length)
+        """
+        capacity = len(self._audio_buffer)
+        count = len(pcm_bytes)
+        write = self._write_index
+        first = min(count, capacity - write)
+        self._ring_view[write : write + first] = pcm_bytes[:first]
+        if first < count:
+            self._ring_view[: count - first] = pcm_bytes[first:]
+        self._write_index = (write + count) % capacity
+        self._buffered += count
+
+    def _next_frame(self) -> memoryview:
+        """
+        Pop one Porcupine frame from the ring.
+
+        Returns:
+            int16 memoryview over the ring if the frame is contiguous,
+            otherwise over the scratch copy of the wrapped frame
+        """
+        capacity = len(self._audio_buffer)
+        start = self._read_index
+        end = start + self._frame_bytes
+
+        if end <= capacity:
+            frame = self._ring_view[start:end].cast("h")
+        else:
+            head = capacity - start
+            self._frame_scratch[:head] = self._ring_view[start:]
+            self._frame_scratch[head:] = self._ring_view[: end - capacity]
+            frame = self._scratch_frame
+
+        self._read_index = end % capacity
+        self._buffered -= self._frame_bytes
+        return frame
+
+    def stop_listening(self) -> None:
+        """Disable wake word detection and drop buffered pre-pause audio."""
+        super().stop_listening()
+        self.reset()
+
     def reset(self) -> None:
         """Reset detector state."""
-        self._audio_buffer.clear()
+        self._read_index = 0
+        self._write_index = 0
+        self._buffered = 0
         logger.debug("Porcupine detector reset")
 
     def cleanup(self) -> None:
         """Clean up Porcupine resources."""
-        if hasattr(self, "_porcupine") and self._porcupine:
-            self._porcupine.delete()
-            logger.debug("Porcupine resources released")
+        porcupine = getattr(self, "_porcupine", None)
+        if porcupine is None:
+            return
+
+        # Drop the handle first so repeated calls never delete twice
+        self._porcupine = None
+        porcupine.delete()
+        logger.debug("Porcupine resources released")
 
     def __del__(self):
         """Ensure cleanup on deletion."""
-        self.cleanup()
+        if getattr(self, "_porcupine", None) is None:
+            return
+        try:
+            self.cleanup()
+        except Exception:
+            pass
 
     @property
     def sample_rate(self) -> int:
@@ -247,8 +372,8 @@ def main():
             f"  [{dev['index']}] {dev['name']} - {dev['channels']} ch, {dev['sample_rate']} Hz"
         )
 
-    # Try to find USB mic, otherwise use default
-    usb_mic = find_usb_mic()
+    # Try to find USB mic in the same scan, otherwise use default
+    usb_mic = find_usb_mic(input_devices)
     if usb_mic:
         mic_device = usb_mic["index"]
         print(f"\n✓ Using USB microphone: {usb_mic['name']}")
@@ -268,7 +393,7 @@ def main():
             sensitivity=0.5,
         )
     except Exception as e:
-        logger.error(f"Failed to create detector: {e}")
+        logger.error("Failed to create detector: %s", e)
         print("\n❌ Error creating Porcupine detector")
         print("Make sure PORCUPINE_ACCESS_KEY is set in .env")
         print(f"Model path: {env_vars.PORCUPINE_MODEL_PATH}")
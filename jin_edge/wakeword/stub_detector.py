@@ -5,10 +5,34 @@ Temporary placeholder for real ML-based wake word detection.
 Maintains interface compatibility for future implementation.
 """
 
+import math
+import os
 import struct
+import sys
 import logging
 from typing import Callable, Optional
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numpy_rms import rms as _simd_rms
+
+    HAS_NUMPY_RMS = True
+except ImportError:
+    HAS_NUMPY_RMS = False
+
+try:
+    from numba import njit, types
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 try:
     from wakeword.base import WakeWordDetector, WakeWordEvent
 except ImportError:
@@ -17,6 +41,31 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+if HAS_NUMBA:
+
+    # Eager signatures compile at import instead of on the first chunk;
+    # np.frombuffer over bytes yields a read-only array
+    @njit(
+        [
+            types.UniTuple(types.int64, 2)(
+                types.Array(types.int16, 1, "C", readonly=True)
+            ),
+            types.UniTuple(types.int64, 2)(types.Array(types.int16, 1, "C")),
+        ],
+        cache=True,
+        fastmath=True,
+    )
+    def _stats_i16(samples):
+        """Sum and sum of squares of int16 samples in a single nopython pass."""
+        total = 0
+        sum_squares = 0
+        for i in range(samples.size):
+            value = np.int64(samples[i])
+            total += value
+            sum_squares += value * value
+        return total, sum_squares
+
+
 class StubWakeWordDetector(WakeWordDetector):
     """
     Stub wake word detector using simple RMS energy threshold.
@@ -57,6 +106,7 @@ class StubWakeWordDetector(WakeWordDetector):
         cooldown_ms: int = 3000,
         sample_rate: int = 16000,
         chunk_duration_ms: int = 30,
+        batch_chunks: int = 1,
     ):
         """
         Initialize stub wake word detector.
@@ -69,6 +119,8 @@ class StubWakeWordDetector(WakeWordDetector):
             cooldown_ms: Milliseconds to wait before allowing another detection (default: 3000)
             sample_rate: Audio sample rate in Hz
             chunk_duration_ms: Expected chunk duration in milliseconds
+            batch_chunks: Chunks to buffer per vectorized RMS pass (default: 1,
+                no batching); adds (batch_chunks - 1) * chunk_duration_ms latency
         """
         super().__init__(wake_word, on_detection)
         self.detection_threshold = detection_threshold
@@ -85,6 +137,23 @@ class StubWakeWordDetector(WakeWordDetector):
         self.cooldown_chunks = max(1, int(cooldown_ms / chunk_duration_ms))
         self._cooldown_counter = 0
 
+        # Compiled unpacker for the expected chunk size, plus a cache for
+        # unexpected sizes (fallback without numpy)
+        self._expected_samples = sample_rate * chunk_duration_ms // 1000
+        self._unpacker = struct.Struct("<%dh" % self._expected_samples)
+        self._unpack_cache: dict[int, struct.Struct] = {}
+
+        # rms > threshold  <=>  sum_squares > threshold^2 * num_samples
+        self._ss_threshold = detection_threshold**2 * self._expected_samples
+
+        # Batch of expected-size chunks scored together (requires numpy)
+        self._batch_buffer = (
+            np.empty((batch_chunks, self._expected_samples), dtype=np.int16)
+            if batch_chunks > 1 and HAS_NUMPY
+            else None
+        )
+        self._batch_index = 0
+
         logger.info(
             f"Stub wake word detector initialized "
             f"(threshold={detection_threshold}, sustained={sustained_duration_ms}ms, cooldown={cooldown_ms}ms)"
@@ -106,41 +175,153 @@ class StubWakeWordDetector(WakeWordDetector):
         if not pcm_bytes or len(pcm_bytes) < 2:
             return None
 
+        # Batched scoring for expected-size chunks; odd sizes go one by one
+        if (
+            self._batch_buffer is not None
+            and len(pcm_bytes) == self._expected_samples * 2
+        ):
+            return self._process_batched(pcm_bytes)
+
         # Handle cooldown period
         if self._cooldown_counter > 0:
             self._cooldown_counter -= 1
             self._sustained_counter = 0  # Reset sustained counter during cooldown
             return None
 
-        # Calculate RMS energy
-        rms = self._calculate_rms(pcm_bytes)
+        num_samples = len(pcm_bytes) // 2
+
+        # Compare the sum of squares against threshold^2 * n (no sqrt),
+        # unless a cheap peak probe already proves the chunk is quiet
+        # (RMS never exceeds the peak amplitude)
+        peak = self._calculate_peak(pcm_bytes)
+        if peak is not None and peak <= self.detection_threshold:
+            sum_squares = None
+            above_threshold = False
+        else:
+            sum_squares = self._calculate_sum_squares(pcm_bytes)
+            if num_samples == self._expected_samples:
+                ss_threshold = self._ss_threshold
+            else:
+                ss_threshold = self.detection_threshold**2 * num_samples
+            above_threshold = sum_squares > ss_threshold
+
+        # RMS itself is only needed for debug logs
+        rms = None
+        if logger.isEnabledFor(logging.DEBUG):
+            if sum_squares is not None:
+                rms = math.sqrt(sum_squares / num_samples)
+            elif self._sustained_counter > 0:
+                # The probe skipped the sum, so only the peak is known
+                logger.debug(
+                    "Below threshold: peak=%.1f, resetting counter from %d",
+                    peak,
+                    self._sustained_counter,
+                )
+
+        return self._update_sustained(above_threshold, rms)
+
+    def _process_batched(self, pcm_bytes: bytes) -> Optional[WakeWordEvent]:
+        """
+        Buffer a chunk and score the whole batch once it is full.
+
+        All sums of squares come from one einsum call; the cooldown and
+        sustained-detection state then advances chunk by chunk.
+
+        Args:
+            pcm_bytes: Raw PCM audio bytes of the expected chunk size
+
+        Returns:
+            WakeWordEvent.DETECTED if any chunk in the batch triggered
+        """
+        batch = self._batch_buffer
+        batch[self._batch_index] = np.frombuffer(pcm_bytes, dtype=np.int16)
+        self._batch_index += 1
+        if self._batch_index < len(batch):
+            return None
+        self._batch_index = 0
+
+        # int64: a full-scale chunk's sum of squares overflows int32
+        wide = batch.astype(np.int64)
+        sums_squares = np.einsum("ij,ij->i", wide, wide).tolist()
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        detected = None
+        for sum_squares in sums_squares:
+            if self._cooldown_counter > 0:
+                self._cooldown_counter -= 1
+                self._sustained_counter = 0
+                continue
+
+            rms = math.sqrt(sum_squares / self._expected_samples) if debug else None
+            event = self._update_sustained(sum_squares > self._ss_threshold, rms)
+            detected = detected or event
+
+        return detected
 
+    def _update_sustained(
+        self, above_threshold: bool, rms: Optional[float]
+    ) -> Optional[WakeWordEvent]:
+        """
+        Advance sustained-detection state by one chunk (outside cooldown).
+
+        Args:
+            above_threshold: Whether the chunk's RMS exceeds the threshold
+            rms: Chunk RMS for debug logs (None when DEBUG is disabled)
+
+        Returns:
+            WakeWordEvent.DETECTED if sustained threshold exceeded, None otherwise
+        """
         # Sustained detection - require multiple consecutive chunks above threshold
-        if rms > self.detection_threshold:
+        if above_threshold:
             self._sustained_counter += 1
-            logger.debug(
-                f"Above threshold: RMS={rms:.1f}, counter={self._sustained_counter}/{self.sustained_chunks_needed}"
-            )
+            if rms is not None:
+                logger.debug(
+                    "Above threshold: RMS=%.1f, counter=%d/%d",
+                    rms,
+                    self._sustained_counter,
+                    self.sustained_chunks_needed,
+                )
 
             # Check if we've sustained the threshold long enough
             if self._sustained_counter >= self.sustained_chunks_needed:
-                logger.debug(
-                    f"Wake word detected: RMS={rms:.1f}, "
-                    f"sustained for {self._sustained_counter} chunks"
-                )
+                if rms is not None:
+                    logger.debug(
+                        "Wake word detected: RMS=%.1f, sustained for %d chunks",
+                        rms,
+                        self._sustained_counter,
+                    )
                 self._cooldown_counter = self.cooldown_chunks
                 self._sustained_counter = 0
                 return self._trigger_detection()
         else:
             # Reset counter if we drop below threshold
-            if self._sustained_counter > 0:
+            if rms is not None and self._sustained_counter > 0:
                 logger.debug(
-                    f"Below threshold: RMS={rms:.1f}, resetting counter from {self._sustained_counter}"
+                    "Below threshold: RMS=%.1f, resetting counter from %d",
+                    rms,
+                    self._sustained_counter,
                 )
             self._sustained_counter = 0
 
         return None
 
+    def _calculate_peak(self, pcm_bytes: bytes) -> Optional[float]:
+        """
+        Calculate peak absolute amplitude of PCM audio.
+
+        Args:
+            pcm_bytes: Raw PCM audio bytes (16-bit signed int)
+
+        Returns:
+            Peak amplitude, or None if numpy is unavailable
+        """
+        if not HAS_NUMPY:
+            return None
+
+        samples = np.frombuffer(pcm_bytes, dtype=np.int16, count=len(pcm_bytes) // 2)
+        # max/min instead of abs(): abs(-32768) overflows int16
+        return float(max(int(samples.max()), -int(samples.min())))
+
     def _calculate_rms(self, pcm_bytes: bytes) -> float:
         """
         Calculate RMS (Root Mean Square) energy of PCM audio.
@@ -155,20 +336,87 @@ class StubWakeWordDetector(WakeWordDetector):
         if num_samples == 0:
             return 0.0
 
-        # Unpack 16-bit signed integers
-        samples = struct.unpack(f"<{num_samples}h", pcm_bytes)
+        return math.sqrt(self._calculate_sum_squares(pcm_bytes) / num_samples)
+
+    def _calculate_sum_squares(self, pcm_bytes: bytes) -> float:
+        """
+        Calculate sum of squared samples of PCM audio.
+
+        Args:
+            pcm_bytes: Raw PCM audio bytes (16-bit signed int)
+
+        Returns:
+            Sum of squares (exact integer except on the numpy-rms path)
+        """
+        num_samples = len(pcm_bytes) // 2
+        if num_samples == 0:
+            return 0
+
+        if HAS_NUMPY_RMS:
+            # SIMD kernel takes float32; one window spanning the whole chunk
+            samples = np.frombuffer(pcm_bytes, dtype=np.int16, count=num_samples)
+            rms = float(_simd_rms(samples.astype(np.float32), num_samples)[0])
+            return rms * rms * num_samples
+
+        if HAS_NUMBA:
+            samples = np.frombuffer(pcm_bytes, dtype=np.int16, count=num_samples)
+            return int(_stats_i16(samples)[1])
+
+        if HAS_NUMPY:
+            # Zero-copy view of 16-bit signed integers
+            samples = np.frombuffer(pcm_bytes, dtype=np.int16, count=num_samples)
+
+            # Exact integer sum of squares in one dot product; int64 avoids
+            # overflow (a full-scale 480-sample chunk exceeds int32)
+            wide = samples.astype(np.int64)
+            return int(np.dot(wide, wide))
+
+        samples = self._unpack_samples(pcm_bytes, num_samples)
+        return sum(sample * sample for sample in samples)
+
+    def _unpack_samples(self, pcm_bytes: bytes, num_samples: int) -> tuple:
+        """
+        Unpack 16-bit signed integers (fallback without numpy).
+
+        Uses the precompiled Struct for the expected chunk size; only
+        chunks of an unexpected size go through the per-size cache.
+        """
+        if num_samples == self._expected_samples:
+            unpacker = self._unpacker
+        else:
+            unpacker = self._unpack_cache.get(num_samples)
+            if unpacker is None:
+                unpacker = struct.Struct("<%dh" % num_samples)
+                self._unpack_cache[num_samples] = unpacker
+        return unpacker.unpack_from(pcm_bytes)
+
+    def start_listening(self) -> None:
+        """Enable wake word detection (restores the real process_chunk)."""
+        self.__dict__.pop("process_chunk", None)
+        super().start_listening()
+
+    def stop_listening(self) -> None:
+        """
+        Disable wake word detection.
 
-        # Calculate RMS: sqrt(mean(x^2))
-        sum_squares = sum(sample * sample for sample in samples)
-        mean_square = sum_squares / num_samples
-        rms = mean_square**0.5
+        While paused, process_chunk is rebound on the instance to a no-op,
+        so per-chunk calls (e.g. during TTS playback) skip every check.
+        A partial batch is dropped so it is not scored with post-resume audio.
+        """
+        super().stop_listening()
+        self._batch_index = 0
+        self.process_chunk = self._process_chunk_paused
 
-        return rms
+    @staticmethod
+    def _process_chunk_paused(pcm_bytes: bytes) -> None:
+        """process_chunk stand-in while paused."""
+        return None
 
     def reset(self) -> None:
         """Reset detector state."""
         self._cooldown_counter = 0
         self._sustained_counter = 0
+        self._batch_index = 0
         logger.debug("Stub detector state reset")
 
     def set_threshold(self, threshold: float) -> None:
@@ -180,8 +428,58 @@ class StubWakeWordDetector(WakeWordDetector):
         """
         old_threshold = self.detection_threshold
         self.detection_threshold = threshold
+        self._ss_threshold = threshold**2 * self._expected_samples
         logger.info(f"Detection threshold updated: {old_threshold} -> {threshold}")
 
+    @staticmethod
+    def pin_to_cpu(cpu_ids: set[int]) -> bool:
+        """
+        Pin the calling thread to the given CPUs for steadier chunk latency.
+
+        Call it from the thread that runs process_chunk (e.g. the wake-word
+        capture thread). Only the calling thread and threads it starts
+        afterwards are affected; threads that already exist keep their
+        affinity.
+
+        Uses sched_setaffinity on Linux. macOS has no affinity API, so the
+        calling thread's QoS is raised to user-interactive instead, which
+        keeps it on performance cores.
+
+        Args:
+            cpu_ids: CPU indices to run on (ignored on macOS)
+
+        Returns:
+            True if applied, False if unsupported or refused
+        """
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, cpu_ids)
+            except OSError as e:
+                logger.warning("Failed to pin to CPUs %s: %s", sorted(cpu_ids), e)
+                return False
+            logger.info("Pinned to CPUs %s", sorted(cpu_ids))
+            return True
+
+        if sys.platform == "darwin":
+            import ctypes
+
+            QOS_CLASS_USER_INTERACTIVE = 0x21
+            try:
+                libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib")
+                result = libc.pthread_set_qos_class_self_np(
+                    QOS_CLASS_USER_INTERACTIVE, 0
+                )
+            except (OSError, AttributeError) as e:
+                logger.warning("Failed to raise thread QoS: %s", e)
+                return False
+            if result != 0:
+                logger.warning("Failed to raise thread QoS (error %d)", result)
+                return False
+            logger.info("Raised thread QoS to user-interactive")
+            return True
+
+        return False
+
     @property
     def cooldown_active(self) -> bool:
         """Check if detector is in cooldown period."""
@@ -4,7 +4,9 @@ Simple, lightweight, no business logic.
 """
 
 import asyncio
+import inspect
 import logging
+import random
 from typing import Awaitable, Callable, Optional, Protocol, Union
 import websockets
 from websockets.asyncio.client import ClientConnection
@@ -65,6 +67,7 @@ class WebSocketClient:
         max_retries: int = 10,
         initial_retry_delay: float = 1.0,
         max_retry_delay: float = 60.0,
+        compression: Optional[str] = None,
     ):
         """
         Initialize WebSocket client.
@@ -78,6 +81,8 @@ class WebSocketClient:
             max_retries: Max reconnection attempts (0 = infinite)
             initial_retry_delay: Initial retry delay in seconds
             max_retry_delay: Maximum retry delay in seconds
+            compression: Per-message compression ("deflate", or None to
+                disable; default None since PCM audio does not compress)
         """
         self.url = url
         self.protocol_handler = protocol_handler
@@ -85,11 +90,23 @@ class WebSocketClient:
         self.on_disconnect = on_disconnect
         self.on_message = on_message
 
+        # Sync/async dispatch per callback, decided once instead of per call
+        self._dispatch_on_connect = self._select_dispatch(on_connect)
+        self._dispatch_on_disconnect = self._select_dispatch(on_disconnect)
+        self._dispatch_on_message = self._select_dispatch(on_message)
+
         self.max_retries = max_retries
         self.initial_retry_delay = initial_retry_delay
         self.max_retry_delay = max_retry_delay
 
+        # Exponential backoff delays by retry count, capped at max_retry_delay
+        self._delay_table = [
+            min(max_retry_delay, initial_retry_delay * (2**i)) for i in range(64)
+        ]
+        self.compression = compression
+
         self._ws: Optional[ClientConnection] = None
+        self._send: Optional[Callable[..., Awaitable[None]]] = None  # ws.send
         self._running = False
         self._connection_task: Optional[asyncio.Task] = None
         self._retry_count = 0
@@ -111,6 +128,7 @@ class WebSocketClient:
         if self._ws:
             await self._ws.close()
             self._ws = None
+            self._send = None
 
         if self._connection_task:
             self._connection_task.cancel()
@@ -120,20 +138,22 @@ class WebSocketClient:
                 pass
             self._connection_task = None
 
-    async def send_text(self, message: str):
+    async def send_text(self, message: str | bytes):
         """
         Send text message (typically JSON).
 
         Args:
-            message: Text string to send
+            message: Text string to send, or UTF-8 encoded bytes
+                (e.g. from orjson.dumps) sent as a text frame without decoding
 
         Raises:
             RuntimeError: If not connected
         """
-        if not self._ws:
+        send = self._send
+        if send is None:
             raise RuntimeError("Not connected to WebSocket server")
 
-        await self._ws.send(message)
+        await send(message, text=True)
 
     async def send_binary(self, data: bytes):
         """
@@ -145,10 +165,11 @@ class WebSocketClient:
         Raises:
             RuntimeError: If not connected
         """
-        if not self._ws:
+        send = self._send
+        if send is None:
             raise RuntimeError("Not connected to WebSocket server")
 
-        await self._ws.send(data)
+        await send(data, text=False)
 
     async def _connection_loop(self):
         """
@@ -158,15 +179,18 @@ class WebSocketClient:
         while self._running:
             try:
                 # Attempt connection
-                async with websockets.connect(self.url) as ws:
+                async with websockets.connect(
+                    self.url, compression=self.compression
+                ) as ws:
                     self._ws = ws
+                    self._send = ws.send  # Bound once per connection
                     self._retry_count = 0  # Reset on successful connect
 
                     logger.info(f"Connected to {self.url}")
 
                     # Trigger on_connect callback
                     if self.on_connect:
-                        await self._safe_callback(self.on_connect)
+                        await self._dispatch_on_connect(self.on_connect)
 
                     # Receive loop
                     await self._receive_loop()
@@ -180,9 +204,10 @@ class WebSocketClient:
 
                 # Trigger on_disconnect callback
                 if self.on_disconnect:
-                    await self._safe_callback(self.on_disconnect)
+                    await self._dispatch_on_disconnect(self.on_disconnect)
 
                 self._ws = None
+                self._send = None
 
                 # Check if we should retry
                 if not self._running:
@@ -206,22 +231,50 @@ class WebSocketClient:
         """
         Receive messages from WebSocket.
         Runs until connection closes or error occurs.
+
+        One of four loops is picked up front depending on which of
+        protocol_handler and on_message are set, so the per-message path
+        carries no checks or lookups for consumers that are absent.
         """
-        try:
-            async for message in self._ws:
-                if not self._running:
-                    break
+        ws = self._ws
+        handler = self.protocol_handler
+        on_message = self.on_message
+        dispatch = self._dispatch_on_message
 
-                # Route message through protocol handler if available
-                if self.protocol_handler:
+        try:
+            if handler and on_message:
+                handle_json = handler.handle_json_message
+                handle_binary = handler.handle_binary_message
+                async for message in ws:
+                    if not self._running:
+                        break
                     if isinstance(message, str):
-                        await self.protocol_handler.handle_json_message(message)
+                        await handle_json(message)
                     else:
-                        await self.protocol_handler.handle_binary_message(message)
+                        await handle_binary(message)
+                    await dispatch(on_message, message)
+
+            elif handler:
+                handle_json = handler.handle_json_message
+                handle_binary = handler.handle_binary_message
+                async for message in ws:
+                    if not self._running:
+                        break
+                    if isinstance(message, str):
+                        await handle_json(message)
+                    else:
+                        await handle_binary(message)
 
-                # Also call on_message callback if provided
-                if self.on_message:
-                    await self._safe_callback(self.on_message, message)
+            elif on_message:
+                async for message in ws:
+                    if not self._running:
+                        break
+                    await dispatch(on_message, message)
+
+            else:
+                async for message in ws:
+                    if not self._running:
+                        break
 
         except websockets.ConnectionClosed:
             logger.info("Connection closed")
@@ -230,17 +283,38 @@ class WebSocketClient:
 
     def _calculate_retry_delay(self) -> float:
         """
-        Calculate exponential backoff delay.
+        Calculate exponential backoff delay with decorrelated jitter.
+
+        Jitter spreads out reconnects when a server restart drops many
+        clients at once.
 
         Returns:
             Delay in seconds (capped at max_retry_delay)
         """
-        delay = self.initial_retry_delay * (2**self._retry_count)
+        backoff = self._delay_table[min(self._retry_count, 63)]
+        delay = random.uniform(self.initial_retry_delay, backoff * 3)
         return min(delay, self.max_retry_delay)
 
-    async def _safe_callback(self, callback: Callable, *args):
+    def _select_dispatch(self, callback: Optional[Callable]) -> Callable:
+        """
+        Pick the dispatcher for a callback based on whether it is async.
+
+        Args:
+            callback: Callback function (or None)
+
+        Returns:
+            _await_cb for coroutine functions, _call_sync_cb otherwise
+        """
+        if callback is not None and inspect.iscoroutinefunction(callback):
+            return self._await_cb
+        return self._call_sync_cb
+
+    async def _call_sync_cb(self, callback: Callable, *args):
         """
-        Execute callback safely, catching and logging exceptions.
+        Execute sync callback safely, catching and logging exceptions.
+
+        A plain callable that returns an awaitable (e.g. a lambda wrapping
+        a coroutine function) still has its result awaited.
 
         Args:
             callback: Callback function to execute
@@ -248,12 +322,24 @@ class WebSocketClient:
         """
         try:
             result = callback(*args)
-            # Handle async callbacks
-            if asyncio.iscoroutine(result):
+            if inspect.isawaitable(result):
                 await result
         except Exception as e:
             logger.error(f"Error in callback {callback.__name__}: {e}")
 
+    async def _await_cb(self, callback: Callable, *args):
+        """
+        Await async callback safely, catching and logging exceptions.
+
+        Args:
+            callback: Coroutine function to execute
+            *args: Arguments to pass to callback
+        """
+        try:
+            await callback(*args)
+        except Exception as e:
+            logger.error(f"Error in callback {callback.__name__}: {e}")
+
     @property
     def is_connected(self) -> bool:
         """Check if currently connected."""